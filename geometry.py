@@ -1,5 +1,30 @@
+import math
+from dataclasses import dataclass
 from enum import Enum
-from shapely.geometry import Polygon, Point
+from functools import cached_property, lru_cache
+from typing import NamedTuple
+import numpy as np
+import shapely
+from shapely.geometry import Polygon
+
+if int(shapely.__version__.split(".")[0]) < 2:
+    raise ImportError("Calcrete requires Shapely 2.x for vectorized GEOS operations")
+
+# Closed unit circle with 64 segments, scaled by the radius in Circular.shape
+_UNIT_RING_THETA = np.linspace(0, 2 * np.pi, 65)
+_UNIT_RING = np.stack([np.cos(_UNIT_RING_THETA), np.sin(_UNIT_RING_THETA)], axis=1)
+_UNIT_RING[-1] = _UNIT_RING[0]
+_UNIT_RING.flags.writeable = False
+
+
+def unit_ring() -> np.ndarray:
+    """
+    Closed unit circle used to tessellate circular geometries.
+
+    Returns:
+        np.ndarray: A read-only (65, 2) array of coordinates, closing back on the first one.
+    """
+    return _UNIT_RING
 
 
 class GeometryType(Enum):
@@ -10,6 +35,38 @@ class GeometryType(Enum):
     CIRCULAR = 2
 
 
+class Coordinates(NamedTuple):
+    """
+    Lightweight pair of plane coordinates.
+
+    Attributes:
+        x (float): The x-coordinate.
+        y (float): The y-coordinate.
+    """
+    x: float
+    y: float
+
+
+_ORIGIN = Coordinates(0.0, 0.0)
+
+
+@dataclass(slots=True, frozen=True)
+class SectionProps:
+    """
+    Geometric properties of a section.
+
+    Attributes:
+        area (float): The area of the section.
+        perimeter (float): The perimeter of the section.
+        cx (float): The x-coordinate of the centroid.
+        cy (float): The y-coordinate of the centroid.
+    """
+    area: float
+    perimeter: float
+    cx: float
+    cy: float
+
+
 class Geometry:
     """
     Base class for geometric shapes.
@@ -34,6 +91,12 @@ class Rectangular(Geometry):
     Attributes:
         length_1 (float): The length of the rectangle along one axis.
         length_2 (float): The length of the rectangle along the other axis.
+        area (float): The area of the rectangle.
+        perimeter (float): The perimeter of the rectangle.
+        cx (float): The x-coordinate of the centroid.
+        cy (float): The y-coordinate of the centroid.
+        centroid (Coordinates): The (x, y) coordinates of the centroid; use
+            ``shape.centroid`` when a Shapely Point is required.
     """
     def __init__(self, length_1: float, length_2: float) -> None:
         """
@@ -46,75 +109,58 @@ class Rectangular(Geometry):
         super().__init__(GeometryType.RECTANGULAR)
         self.length_1 = length_1
         self.length_2 = length_2
+        self.area = length_1 * length_2
+        self.perimeter = 2.0 * (length_1 + length_2)
+        self.cx = length_1 * 0.5
+        self.cy = length_2 * 0.5
 
-    @property
-    def vertices(self) -> list[tuple[float, float]]:
+    @cached_property
+    def centroid(self) -> Coordinates:
         """
-        List of vertices for the rectangle.
+        Centroid of the rectangle, built once on first access.
 
         Returns:
-            list[tuple[float, float]]: A list of tuples representing the vertices.
+            Coordinates: The (x, y) coordinates of the centroid.
         """
-        return [
-            (0, 0),  # Bottom-left corner
-            (self.length_1, 0),  # Bottom-right corner
-            (self.length_1, self.length_2),  # Top-right corner
-            (0, self.length_2),  # Top-left corner
-            (0, 0)  # Closing the polygon back to the bottom-left corner
-        ]
+        return Coordinates(self.cx, self.cy)
 
-    @property
-    def shape(self) -> Polygon:
+    @cached_property
+    def vertices(self) -> np.ndarray:
         """
-        Polygon object representing the rectangle.
+        Vertices of the rectangle, built once on first access.
 
         Returns:
-            Polygon: A Shapely Polygon object of the rectangle.
+            np.ndarray: A read-only (5, 2) array of vertex coordinates, closing back on the
+                first vertex.
         """
-        return Polygon(self.vertices)
-
-    @property
-    def area(self) -> float:
-        """
-        Calculates the area of the rectangle.
-
-        Returns:
-            float: The area of the rectangle.
-        """
-        return self.shape.area
-
-    @property
-    def perimeter(self) -> float:
-        """
-        Calculates the perimeter of the rectangle.
-
-        Returns:
-            float: The perimeter of the rectangle.
-        """
-        return self.shape.length
-
-    @property
-    def centroid(self) -> Point:
+        vertices = np.array([
+            [0, 0],  # Bottom-left corner
+            [self.length_1, 0],  # Bottom-right corner
+            [self.length_1, self.length_2],  # Top-right corner
+            [0, self.length_2],  # Top-left corner
+            [0, 0]  # Closing the polygon back to the bottom-left corner
+        ], dtype=np.float64)
+        vertices.flags.writeable = False
+        return vertices
+
+    @cached_property
+    def shape(self) -> Polygon:
         """
-        Calculates the centroid of the rectangle.
+        Polygon object representing the rectangle, built once per instance.
 
         Returns:
-            Point: A Shapely Point object representing the centroid.
+            Polygon: A Shapely Polygon object of the rectangle.
         """
-        return self.shape.centroid
+        return Polygon(self.vertices)
 
-    def properties_dict(self) -> dict:
+    def properties(self) -> SectionProps:
         """
-        Returns a dictionary of all geometric properties of the rectangle.
+        Returns all geometric properties of the rectangle.
 
         Returns:
-            dict: A dictionary containing the area, perimeter, and centroid.
+            SectionProps: The area, perimeter, and centroid coordinates.
         """
-        return {
-            "Area": self.area,
-            "Perimeter": self.perimeter,
-            "Centroid": (self.centroid.x, self.centroid.y)
-        }
+        return SectionProps(self.area, self.perimeter, self.cx, self.cy)
 
 
 class Circular(Geometry):
@@ -123,6 +169,12 @@ class Circular(Geometry):
 
     Attributes:
         radius (float): The radius of the circle.
+        area (float): The area of the circle.
+        perimeter (float): The circumference of the circle.
+        cx (float): The x-coordinate of the centroid.
+        cy (float): The y-coordinate of the centroid.
+        centroid (Coordinates): The (x, y) coordinates of the centroid; use
+            ``shape.centroid`` when a Shapely Point is required.
     """
     def __init__(self, radius: float) -> None:
         """
@@ -133,78 +185,125 @@ class Circular(Geometry):
         """
         super().__init__(GeometryType.CIRCULAR)
         self.radius = radius
+        self.area = math.pi * radius * radius
+        self.perimeter = 2.0 * math.pi * radius
+        self.cx = 0.0
+        self.cy = 0.0
+        self.centroid = _ORIGIN
 
-    @property
+    @cached_property
     def shape(self) -> Polygon:
         """
-        Polygon object representing the circle using buffer.
+        Polygon object approximating the circle with 64 segments, built once per instance.
 
         Returns:
             Polygon: A Shapely Polygon object of the circle.
         """
-        return Point(0, 0).buffer(self.radius)
+        return Polygon(_UNIT_RING * self.radius)
     
     @property
     def diameter(self) -> float:
         return self.radius*2
 
-    @property
-    def area(self) -> float:
+    def properties(self) -> SectionProps:
         """
-        Calculates the area of the circle.
+        Returns all geometric properties of the circle.
 
         Returns:
-            float: The area of the circle.
+            SectionProps: The area, perimeter, and centroid coordinates.
         """
-        return self.shape.area
+        return SectionProps(self.area, self.perimeter, self.cx, self.cy)
 
-    @property
-    def perimeter(self) -> float:
-        """
-        Calculates the circumference of the circle.
 
-        Returns:
-            float: The circumference of the circle.
-        """
-        return self.shape.length
+class _FrozenGeometry:
+    """
+    Mixin making a geometry read-only once initialized, for instances shared by the factories.
+    """
+    def __setattr__(self, name: str, value) -> None:
+        if "_frozen" in self.__dict__:
+            raise AttributeError(f"{type(self).__name__} is immutable; create a new instance instead")
+        super().__setattr__(name, value)
 
-    @property
-    def centroid(self) -> Point:
-        """
-        Calculates the centroid of the circle.
+    def __delattr__(self, name: str) -> None:
+        if "_frozen" in self.__dict__:
+            raise AttributeError(f"{type(self).__name__} is immutable; create a new instance instead")
+        super().__delattr__(name)
 
-        Returns:
-            Point: A Shapely Point object representing the centroid.
-        """
-        return self.shape.centroid
 
-    def properties_dict(self) -> dict:
-        """
-        Returns a dictionary of all geometric properties of the circle.
+class FrozenRectangular(_FrozenGeometry, Rectangular):
+    """
+    Read-only Rectangular geometry returned by make_rectangular.
+    """
+    def __init__(self, length_1: float, length_2: float) -> None:
+        super().__init__(length_1, length_2)
+        self.__dict__["_frozen"] = True
 
-        Returns:
-            dict: A dictionary containing the area, perimeter, and centroid.
-        """
-        return {
-            "Area": self.area,
-            "Perimeter": self.perimeter,
-            "Centroid": (self.centroid.x, self.centroid.y)
-        }
+
+class FrozenCircular(_FrozenGeometry, Circular):
+    """
+    Read-only Circular geometry returned by make_circular.
+    """
+    def __init__(self, radius: float) -> None:
+        super().__init__(radius)
+        self.__dict__["_frozen"] = True
+
+
+def make_rectangular(length_1: float, length_2: float) -> Rectangular:
+    """
+    Returns a shared, read-only Rectangular geometry for the given lengths.
+
+    Instances are cached and reused across calls; lengths are normalized to float so that
+    equal values share an instance.
+
+    Parameters:
+        length_1 (float): The length of the rectangle along one axis.
+        length_2 (float): The length of the rectangle along the other axis.
+
+    Returns:
+        Rectangular: The cached FrozenRectangular geometry.
+    """
+    return _cached_rectangular(float(length_1), float(length_2))
+
+
+def make_circular(radius: float) -> Circular:
+    """
+    Returns a shared, read-only Circular geometry for the given radius.
+
+    Instances are cached and reused across calls; the radius is normalized to float so that
+    equal values share an instance.
+
+    Parameters:
+        radius (float): The radius of the circle.
+
+    Returns:
+        Circular: The cached FrozenCircular geometry.
+    """
+    return _cached_circular(float(radius))
+
+
+@lru_cache(maxsize=1024)
+def _cached_rectangular(length_1: float, length_2: float) -> Rectangular:
+    return FrozenRectangular(length_1, length_2)
+
+
+@lru_cache(maxsize=1024)
+def _cached_circular(radius: float) -> Circular:
+    return FrozenCircular(radius)
 
 
 # Example usage
 if __name__ == "__main__":
     rectangle = Rectangular(length_1=4, length_2=3)
     print("Rectangle Properties:")
-    print(f"Vertices: {rectangle.vertices}")
+    print(f"Vertices: {rectangle.vertices.tolist()}")
     print(f"Area: {rectangle.area}")
     print(f"Perimeter: {rectangle.perimeter}")
     print(f"Centroid: {rectangle.centroid}")
-    print(f"Properties: {rectangle.properties_dict()}")
+    print(f"Properties: {rectangle.properties()}")
 
     circle = Circular(radius=5)
     print("\nCircle Properties:")
     print(f"Area: {circle.area}")
     print(f"Perimeter: {circle.perimeter}")
     print(f"Centroid: {circle.centroid}")
-    print(f"Properties: {circle.properties_dict()}")
+    print(f"Properties: {circle.properties()}")
@@ -1,4 +1,16 @@
-from geometry import Circular
+import math
+import operator
+import numpy as np
+import shapely
+from geometry import Circular, Coordinates, make_circular, unit_ring
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional, the batch kernels then run as plain Python
+    prange = range
+
+    def njit(*args, **kwargs):
+        return lambda function: function
 
 class Bar:
     """
@@ -7,6 +19,8 @@ class Bar:
     Attributes:
         geometry (Circular): The circular geometry of the bar.
     """
+    __slots__ = ("geometry", "x", "y")
+
     def __init__(self, geometry: Circular) -> None:
         """
         Initializes a Bar instance with a given circular geometry.
@@ -58,10 +72,9 @@ class Bar:
             tuple: The coordinates (x, y) of the bar.
             str: Message indicating coordinates are not set.
         """
-        try:
-            return (self.x, self.y)
-        except AttributeError:
+        if self.x is None:
             return "No coordinates assigned yet"
+        return (self.x, self.y)
 
 
 class Reinforcement:
@@ -74,7 +87,12 @@ class Reinforcement:
         location (str): The location of the reinforcement.
         quantity (int): The quantity of bars.
         spacing (float): The spacing between bars.
+        xs (np.ndarray): The x-coordinates of the bars.
+        ys (np.ndarray): The y-coordinates of the bars.
+        diameters (np.ndarray): The diameters of the bars.
     """
+    __slots__ = ("_bar", "cover", "location", "_quantity", "spacing", "xs", "ys", "diameters")
+
     def __init__(self, bar: Bar = None, cover: float = None, location: str = None, 
                  quantity: int = None, spacing: float = None) -> None:
         """
@@ -87,12 +105,155 @@ class Reinforcement:
             quantity (int): The quantity of bars.
             spacing (float): The spacing between bars.
         """
-        self.bar = bar
+        self._bar = bar
+        self._quantity = None
+        self._allocate_bars(0)
         self.cover = cover
         self.location = location
         self.quantity = quantity
         self.spacing = spacing
 
+    @property
+    def bar(self) -> Bar:
+        """
+        The reinforcing bar, whose diameter fills the diameters array.
+
+        Returns:
+            Bar: The reinforcing bar.
+        """
+        return self._bar
+
+    @bar.setter
+    def bar(self, bar: Bar) -> None:
+        self._bar = bar
+        self.diameters = np.full(self.xs.shape, self._bar_diameter(), dtype=float)
+
+    @property
+    def quantity(self) -> int:
+        """
+        The quantity of bars. Setting a different count resizes the bar arrays and resets
+        all coordinates to unassigned; setting the same count keeps them.
+
+        Returns:
+            int: The quantity of bars.
+        """
+        return self._quantity
+
+    @quantity.setter
+    def quantity(self, quantity: int) -> None:
+        n = int(quantity) if quantity is not None else 0
+        if n < 0:
+            raise ValueError("Quantity must not be negative.")
+        self._quantity = quantity
+        if n != self.xs.size:
+            self._allocate_bars(n)
+
+    def _bar_diameter(self) -> float:
+        """
+        Returns the diameter of the bar, or NaN when no bar is set.
+        """
+        return self._bar.diameter if self._bar is not None else np.nan
+
+    def _allocate_bars(self, n: int) -> None:
+        """
+        Sizes the bar arrays to n bars, with unset coordinates as NaN.
+
+        Parameters:
+            n (int): The number of bars.
+        """
+        self.xs = np.full(n, np.nan)
+        self.ys = np.full(n, np.nan)
+        self.diameters = np.full(n, self._bar_diameter(), dtype=float)
+
+    def _require_bar(self) -> None:
+        """
+        Raises ValueError when no bar is set.
+        """
+        if self._bar is None:
+            raise ValueError("Provide a valid bar first.")
+
+    def _require_coordinates(self) -> None:
+        """
+        Raises ValueError when any bar has unassigned coordinates.
+        """
+        if np.isnan(self.xs).any() or np.isnan(self.ys).any():
+            raise ValueError("Provide the coordinates of all bars first.")
+
+    @property
+    def bars(self) -> list[Bar]:
+        """
+        Materializes one Bar per position in the bar arrays. Bars without assigned
+        coordinates keep x and y as None.
+
+        Returns:
+            list[Bar]: The bars of the reinforcement.
+        """
+        self._require_bar()
+        bars = []
+        for x, y, diameter in zip(self.xs.tolist(), self.ys.tolist(), self.diameters.tolist()):
+            bar = Bar(make_circular(diameter / 2))
+            if not (math.isnan(x) or math.isnan(y)):
+                bar.set_coordinates(x, y)
+            bars.append(bar)
+        return bars
+
+    @property
+    def total_area(self) -> float:
+        """
+        Calculates the total area of the bars.
+
+        Returns:
+            float: The sum of the areas of all bars.
+        """
+        self._require_bar()
+        return float(0.25 * np.pi * np.sum(self.diameters ** 2))
+
+    @property
+    def group_centroid(self) -> Coordinates:
+        """
+        Calculates the area-weighted centroid of the bars.
+
+        Returns:
+            Coordinates: The (x, y) coordinates of the centroid of the bar group.
+        """
+        self._require_bar()
+        self._require_coordinates()
+        areas = 0.25 * np.pi * self.diameters ** 2
+        total = np.sum(areas)
+        if not total > 0:
+            raise ValueError("Total bar area must be greater than 0 to calculate the centroid.")
+        return Coordinates(float(np.sum(self.xs * areas) / total),
+                           float(np.sum(self.ys * areas) / total))
+
+    @staticmethod
+    def build_bar_geometries(xs: np.ndarray, ys: np.ndarray, r: float | np.ndarray) -> np.ndarray:
+        """
+        Builds the circular geometries of many bars in a single vectorized call.
+
+        Parameters:
+            xs (np.ndarray): The x-coordinates of the bar centers.
+            ys (np.ndarray): The y-coordinates of the bar centers.
+            r (float | np.ndarray): The radius of the bars, either shared or one per bar.
+
+        Returns:
+            np.ndarray: An array of Shapely Polygon objects, one per bar.
+        """
+        centers = np.stack([np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)], axis=1)
+        radii = np.asarray(r, dtype=float).reshape(-1, 1, 1)
+        coords = centers[:, None, :] + radii * unit_ring()
+        return shapely.polygons(coords)
+
+    def bar_geometries(self) -> np.ndarray:
+        """
+        Builds the circular geometries of the bars from their coordinates and diameters.
+
+        Returns:
+            np.ndarray: An array of Shapely Polygon objects, one per bar.
+        """
+        self._require_bar()
+        self._require_coordinates()
+        return self.build_bar_geometries(self.xs, self.ys, self.diameters / 2)
+
     # Setters
     def set_cover(self, cover: float) -> None:
         """
@@ -103,6 +264,21 @@ class Reinforcement:
         """
         self.cover = cover
 
+    def set_bar_coordinates(self, xs: np.ndarray, ys: np.ndarray) -> None:
+        """
+        Sets the coordinates of all bars.
+
+        Parameters:
+            xs (np.ndarray): The x-coordinates, one per bar.
+            ys (np.ndarray): The y-coordinates, one per bar.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.shape != self.xs.shape or ys.shape != self.ys.shape:
+            raise ValueError("Provide one coordinate per bar.")
+        self.xs = xs
+        self.ys = ys
+
     def set_location(self, location: str) -> None:
         """
         Sets the location of the reinforcement.
@@ -110,10 +286,7 @@ class Reinforcement:
         Parameters:
             location (str): The location to set.
         """
-        if isinstance(location, str):
-            self.location = location
-        else:
-            raise ValueError("Provide a valid location (string)")
+        self.location = str(location)
 
     def set_quantity(self, quantity: int) -> None:
         """
@@ -122,9 +295,9 @@ class Reinforcement:
         Parameters:
             quantity (int): The quantity to set.
         """
-        if isinstance(quantity, int):
-            self.quantity = quantity
-        else:
+        try:
+            self.quantity = operator.index(quantity)
+        except TypeError:
             raise ValueError("Provide a valid quantity (integer)")
     
     def set_spacing(self, spacing: float) -> None:
@@ -134,9 +307,9 @@ class Reinforcement:
         Parameters:
             spacing (float): The spacing to set.
         """
-        if isinstance(spacing, (int, float)):
-            self.spacing = spacing
-        else:
+        try:
+            self.spacing = float(spacing)
+        except (TypeError, ValueError):
             raise ValueError("Provide a valid spacing (number)")
 
     def calculate_spacing(self, effective_space: float) -> None:
@@ -157,17 +330,115 @@ class Reinforcement:
         """
         Calculates and sets the quantity of bars based on the effective space.
 
+        Integer inputs use floor division; float inputs use true division, which gives the
+        expected count for metric spacings such as 0.2 where float floor division does not.
+
         Parameters:
             effective_space (float): The effective space available for bars.
+
+        Example:
+            >>> reinforcement = Reinforcement(spacing=0.2)
+            >>> reinforcement.calculate_quantity(1.0)
+            >>> reinforcement.quantity
+            6
         """
         try:
-            self.quantity = int(effective_space / self.spacing) + 1
+            if isinstance(self.spacing, int) and isinstance(effective_space, int):
+                self.quantity = effective_space // self.spacing + 1
+            else:
+                self.quantity = int(effective_space / self.spacing) + 1
         except TypeError:
             raise ValueError("Provide a valid spacing first.")
         except ZeroDivisionError:
             raise ValueError("Spacing must be greater than 0 to calculate quantity.")
 
 
+@njit(parallel=True, cache=True)
+def _spacing_kernel(effective_space: np.ndarray, quantity: np.ndarray) -> np.ndarray:
+    n = effective_space.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = effective_space[i] / (quantity[i] - 1)
+    return out
+
+
+@njit(parallel=True, cache=True)
+def _quantity_kernel(effective_space: np.ndarray, spacing: np.ndarray) -> np.ndarray:
+    n = effective_space.shape[0]
+    out = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        out[i] = int(effective_space[i] / spacing[i]) + 1
+    return out
+
+
+def _flatten_batch(effective_space: np.ndarray, values: np.ndarray,
+                   name: str) -> tuple[tuple[int, ...], np.ndarray, np.ndarray]:
+    """
+    Broadcasts the batch inputs together and flattens them for the kernels.
+
+    Parameters:
+        effective_space (np.ndarray): The effective space available for bars in each layout.
+        values (np.ndarray): The per-layout quantities or spacings.
+        name (str): The name of values, used in error messages.
+
+    Returns:
+        tuple: The broadcast shape and both inputs as contiguous 1-D arrays.
+    """
+    effective_space = np.asarray(effective_space, dtype=np.float64)
+    if not np.all(np.isfinite(effective_space)):
+        raise ValueError("Effective space must be finite.")
+    try:
+        effective_space, values = np.broadcast_arrays(effective_space, values)
+    except ValueError:
+        raise ValueError(f"Effective space and {name} must have compatible shapes.")
+    return (effective_space.shape, np.ascontiguousarray(effective_space.ravel()),
+            np.ascontiguousarray(values.ravel()))
+
+
+def batch_spacing(effective_space: np.ndarray, quantity: np.ndarray) -> np.ndarray:
+    """
+    Calculates the spacing between bars for many layouts at once.
+
+    The inputs are broadcast together, so a single quantity can be shared by all layouts.
+
+    Parameters:
+        effective_space (np.ndarray): The effective space available for bars in each layout.
+        quantity (np.ndarray): The quantity of bars in each layout, as integers.
+
+    Returns:
+        np.ndarray: The spacing between bars for each layout.
+    """
+    quantity = np.asarray(quantity)
+    if quantity.size and not np.issubdtype(quantity.dtype, np.integer):
+        raise ValueError("Provide a valid quantity (integer)")
+    if np.any(quantity <= 1):
+        raise ValueError("Quantity must be greater than 1 to calculate spacing.")
+    shape, effective_space, quantity = _flatten_batch(effective_space, quantity, "quantity")
+    return _spacing_kernel(effective_space, quantity.astype(np.int64)).reshape(shape)
+
+
+def batch_quantity(effective_space: np.ndarray, spacing: np.ndarray) -> np.ndarray:
+    """
+    Calculates the quantity of bars for many layouts at once.
+
+    The inputs are broadcast together, so a single spacing can be shared by all layouts.
+
+    Parameters:
+        effective_space (np.ndarray): The effective space available for bars in each layout.
+        spacing (np.ndarray): The spacing between bars in each layout.
+
+    Returns:
+        np.ndarray: The quantity of bars for each layout.
+    """
+    spacing = np.asarray(spacing, dtype=np.float64)
+    if not np.all(np.isfinite(spacing)):
+        raise ValueError("Provide a valid spacing first.")
+    if np.any(spacing <= 0):
+        raise ValueError("Spacing must be greater than 0 to calculate quantity.")
+    shape, effective_space, spacing = _flatten_batch(effective_space, spacing, "spacing")
+    return _quantity_kernel(effective_space, spacing).reshape(shape)
+
+
 # Example usage
 if __name__ == "__main__":
     # Create a Circular geometry for the Bar
@@ -1,12 +1,35 @@
-from geometry import GeometryType, Rectangular, Circular
+from abc import ABC, abstractmethod
+from geometry import GeometryType, Rectangular, Circular, make_rectangular, make_circular
 import math
+import numpy as np
 
-class Element:
+_RECTANGULAR = GeometryType.RECTANGULAR
+_CIRCULAR = GeometryType.CIRCULAR
+
+class Element(ABC):
     """
     Base class for geometric elements.
 
     This class provides methods to set the lengths of different dimensions of a geometric element.
+    Instantiating Element directly returns the RectangularElement or CircularElement matching
+    the geometry section.
     """
+    def __new__(cls, geometry_section: GeometryType = None) -> "Element":
+        """
+        Creates an instance of the Element subclass matching the type of geometry section.
+
+        Parameters:
+            geometry_section (GeometryType): The type of the geometry.
+        """
+        if cls is Element:
+            if geometry_section is _RECTANGULAR:
+                cls = RectangularElement
+            elif geometry_section is _CIRCULAR:
+                cls = CircularElement
+            else:
+                raise ValueError("Unsupported geometry type")
+        return super().__new__(cls)
+
     def __init__(self, geometry_section: GeometryType) -> None:
         """
         Initializes an Element instance with no lengths set.
@@ -18,6 +41,19 @@ class Element:
         self.radius = None
         self.geometry = None
 
+    @staticmethod
+    def create(geometry_section: GeometryType) -> "Element":
+        """
+        Creates the Element subclass matching the type of geometry section.
+
+        Parameters:
+            geometry_section (GeometryType): The type of the geometry.
+
+        Returns:
+            Element: A RectangularElement or CircularElement instance.
+        """
+        return Element(geometry_section)
+
     def set_length_1(self, length: float) -> None:
         """
         Sets the first length dimension of the element.
@@ -54,75 +90,196 @@ class Element:
         """
         self.radius = radius
 
-    def set_geometry(self) -> None:
+    @abstractmethod
+    def set_geometry_from_values(self, *args: float, **kwargs: float) -> None:
         """
-        Sets the geometry of the element based on the type of geometry section.
+        Sets the geometry of the element from given dimensions, implemented by each
+        geometry subclass with the dimensions its geometry requires.
         """
-        if self.section == GeometryType.RECTANGULAR:
-            self.length_1 = float(input("Enter length 1: "))
-            self.length_2 = float(input("Enter length 2: "))
-            self.length_3 = float(input("Enter length 3: "))
-            self.geometry = Rectangular(self.length_1, self.length_2)
-        elif self.section == GeometryType.CIRCULAR:
-            self.radius = float(input("Enter radius: "))
-            self.length_1 = float(input("Enter length: "))
-            self.geometry = Circular(self.radius)
-        else:
-            raise ValueError("Unsupported geometry type")
+        raise NotImplementedError
+
+    @abstractmethod
+    def prompt_geometry(self) -> None:
+        """
+        Prompts for the dimensions of the element and sets its geometry, implemented
+        by each geometry subclass.
+        """
+        raise NotImplementedError
 
     @property
     def section_12(self) -> Rectangular:
         """
-        Returns the cross-section defined by length_1 and length_2.
+        Returns the shared, read-only cross-section defined by length_1 and length_2.
 
         Returns:
             Rectangular: A Rectangular cross-section with dimensions length_1 and length_2.
         """
-        return Rectangular(self.length_1, self.length_2)
+        return make_rectangular(self.length_1, self.length_2)
 
     @property
     def section_13(self) -> Rectangular:
         """
-        Returns the cross-section defined by length_1 and length_3.
+        Returns the shared, read-only cross-section defined by length_1 and length_3.
 
         Returns:
             Rectangular: A Rectangular cross-section with dimensions length_1 and length_3.
         """
-        return Rectangular(self.length_1, self.length_3)
+        return make_rectangular(self.length_1, self.length_3)
 
     @property
     def section_23(self) -> Rectangular:
         """
-        Returns the cross-section defined by length_2 and length_3.
+        Returns the shared, read-only cross-section defined by length_2 and length_3.
 
         Returns:
             Rectangular: A Rectangular cross-section with dimensions length_2 and length_3.
         """
-        return Rectangular(self.length_2, self.length_3)
+        return make_rectangular(self.length_2, self.length_3)
 
     @property
     def circular_section(self) -> Circular:
         """
-        Returns a circular cross-section defined by radius.
+        Returns the shared, read-only circular cross-section defined by radius.
 
         Returns:
             Circular: A Circular cross-section with the specified radius.
         """
-        return Circular(self.radius)
+        return make_circular(self.radius)
+
+    @abstractmethod
+    def volume(self) -> float:
+        """
+        Calculates the volume of the element, implemented by each geometry subclass.
+
+        Returns:
+            float: The volume of the element.
+        """
+        raise NotImplementedError
+
+
+class RectangularElement(Element):
+    """
+    Element with a rectangular geometry section.
+    """
+    def __init__(self, geometry_section: GeometryType = _RECTANGULAR) -> None:
+        """
+        Initializes a RectangularElement instance with no lengths set.
+
+        Parameters:
+            geometry_section (GeometryType): Must be GeometryType.RECTANGULAR; accepted so that
+                Element(GeometryType.RECTANGULAR) can dispatch to this class.
+        """
+        if geometry_section is not _RECTANGULAR:
+            raise ValueError("RectangularElement requires a rectangular geometry section")
+        super().__init__(geometry_section)
+
+    def set_geometry_from_values(self, length_1: float, length_2: float,
+                                 length_3: float) -> None:
+        """
+        Sets the rectangular geometry of the element from given dimensions.
+
+        Parameters:
+            length_1 (float): The first length dimension of the element.
+            length_2 (float): The second length dimension of the element.
+            length_3 (float): The third length dimension of the element.
+        """
+        self.length_1 = length_1
+        self.length_2 = length_2
+        self.length_3 = length_3
+        self.geometry = Rectangular(length_1, length_2)
+
+    def prompt_geometry(self) -> None:
+        """
+        Prompts for the dimensions of the rectangular element and sets its geometry.
+        """
+        length_1 = float(input("Enter length 1: "))
+        length_2 = float(input("Enter length 2: "))
+        length_3 = float(input("Enter length 3: "))
+        self.set_geometry_from_values(length_1, length_2, length_3)
 
     def volume(self) -> float:
         """
-        Calculates the volume of the element based on its geometry type.
+        Calculates the volume of the rectangular element.
 
         Returns:
             float: The volume of the element.
         """
-        if self.section == GeometryType.RECTANGULAR:
-            return self.length_1 * self.length_2 * self.length_3
-        elif self.section == GeometryType.CIRCULAR:
-            return math.pi * (self.radius ** 2) * self.length_1
-        else:
-            raise ValueError("Unsupported geometry type")
+        return self.length_1 * self.length_2 * self.length_3
+
+
+class CircularElement(Element):
+    """
+    Element with a circular geometry section.
+    """
+    def __init__(self, geometry_section: GeometryType = _CIRCULAR) -> None:
+        """
+        Initializes a CircularElement instance with no lengths set.
+
+        Parameters:
+            geometry_section (GeometryType): Must be GeometryType.CIRCULAR; accepted so that
+                Element(GeometryType.CIRCULAR) can dispatch to this class.
+        """
+        if geometry_section is not _CIRCULAR:
+            raise ValueError("CircularElement requires a circular geometry section")
+        super().__init__(geometry_section)
+
+    def set_geometry_from_values(self, length_1: float, radius: float) -> None:
+        """
+        Sets the circular geometry of the element from given dimensions.
+
+        Parameters:
+            length_1 (float): The length of the element.
+            radius (float): The radius of the element.
+        """
+        self.length_1 = length_1
+        self.radius = radius
+        self.geometry = Circular(radius)
+
+    def prompt_geometry(self) -> None:
+        """
+        Prompts for the dimensions of the circular element and sets its geometry.
+        """
+        radius = float(input("Enter radius: "))
+        length_1 = float(input("Enter length: "))
+        self.set_geometry_from_values(length_1, radius=radius)
+
+    def volume(self) -> float:
+        """
+        Calculates the volume of the circular element.
+
+        Returns:
+            float: The volume of the element.
+        """
+        return math.pi * self.radius * self.radius * self.length_1
+
+
+def volumes(kinds: np.ndarray, l1: np.ndarray, l2: np.ndarray, l3: np.ndarray,
+            r: np.ndarray) -> np.ndarray:
+    """
+    Calculates the volumes of many elements at once.
+
+    Rectangular elements use l1 * l2 * l3 and circular elements use pi * r**2 * l1,
+    matching Element.volume. Dimensions unused by an element's geometry type are ignored.
+
+    Parameters:
+        kinds (np.ndarray): The GeometryType values of the elements.
+        l1 (np.ndarray): The first length of each element.
+        l2 (np.ndarray): The second length of each element.
+        l3 (np.ndarray): The third length of each element.
+        r (np.ndarray): The radius of each element.
+
+    Returns:
+        np.ndarray: The volume of each element.
+    """
+    kinds = np.asarray(kinds)
+    l1 = np.asarray(l1, dtype=float)
+    l2 = np.asarray(l2, dtype=float)
+    l3 = np.asarray(l3, dtype=float)
+    r = np.asarray(r, dtype=float)
+    rect_mask = kinds == _RECTANGULAR.value
+    if not np.all(rect_mask | (kinds == _CIRCULAR.value)):
+        raise ValueError("Unsupported geometry type")
+    return np.where(rect_mask, l1 * l2 * l3, np.pi * r * r * l1)
 
 
 # Example usage
@@ -130,13 +287,13 @@ if __name__ == "__main__":
     element_type = input("Enter the type of geometry (rectangular/circular): ").strip().lower()
 
     if element_type == "rectangular":
-        element = Element(GeometryType.RECTANGULAR)
+        element = Element.create(GeometryType.RECTANGULAR)
     elif element_type == "circular":
-        element = Element(GeometryType.CIRCULAR)
+        element = Element.create(GeometryType.CIRCULAR)
     else:
         raise ValueError("Invalid geometry type entered")
 
-    element.set_geometry()
+    element.prompt_geometry()
 
     if element.section == GeometryType.RECTANGULAR:
         section_12 = element.section_12
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from geometry import Circular, FrozenCircular, Rectangular, SectionProps, make_circular, make_rectangular
+
+
+def test_rectangular_vertices_are_read_only_and_cached():
+    rectangle = Rectangular(4, 3)
+    np.testing.assert_array_equal(rectangle.vertices,
+                                  [[0, 0], [4, 0], [4, 3], [0, 3], [0, 0]])
+    assert rectangle.vertices is rectangle.vertices
+    with pytest.raises(ValueError):
+        rectangle.vertices[1, 0] = 99.0
+    assert rectangle.shape.area == pytest.approx(rectangle.area)
+
+
+def test_factories_share_read_only_instances():
+    circle = make_circular(5)
+    assert make_circular(5.0) is circle
+    assert isinstance(circle.radius, float)
+    with pytest.raises(AttributeError):
+        circle.radius = 3.0
+    with pytest.raises(AttributeError):
+        circle.area = 3.0
+    rectangle = make_rectangular(4, 3)
+    assert make_rectangular(4.0, 3.0) is rectangle
+    with pytest.raises(AttributeError):
+        del rectangle.length_1
+    assert rectangle.shape.area == pytest.approx(12.0)
+
+
+def test_plain_geometries_stay_mutable_and_independent():
+    circle = Circular(5.0)
+    circle.label = "column"
+    assert not isinstance(circle, FrozenCircular)
+    assert make_circular(5.0) is not circle
+
+
+def test_section_properties():
+    rectangle = Rectangular(4, 3)
+    assert rectangle.properties() == SectionProps(12, 14.0, 2.0, 1.5)
+    circle = Circular(2.0)
+    assert circle.properties() == SectionProps(np.pi * 4.0, np.pi * 4.0, 0.0, 0.0)
@@ -0,0 +1,171 @@
+import numpy as np
+import pytest
+
+from geometry import Circular
+from reinforcement import Bar, Reinforcement, batch_quantity, batch_spacing
+
+
+def make_reinforcement(quantity=3, radius=1.0):
+    return Reinforcement(bar=Bar(Circular(radius)), quantity=quantity)
+
+
+def test_calculate_quantity_handles_metric_spacing():
+    reinforcement = Reinforcement(spacing=0.2)
+    reinforcement.calculate_quantity(1.0)
+    assert reinforcement.quantity == 6
+
+
+def test_set_quantity_rejects_non_integral_values():
+    reinforcement = make_reinforcement()
+    with pytest.raises(ValueError, match="integer"):
+        reinforcement.set_quantity(2.7)
+
+
+def test_bar_arrays_follow_quantity():
+    reinforcement = make_reinforcement(quantity=2.0)
+    assert reinforcement.xs.shape == reinforcement.diameters.shape == (2,)
+    reinforcement.quantity = 4
+    assert reinforcement.xs.shape == reinforcement.ys.shape == (4,)
+    np.testing.assert_allclose(reinforcement.diameters, 2.0)
+
+
+def test_same_quantity_keeps_coordinates():
+    reinforcement = make_reinforcement(quantity=2)
+    reinforcement.set_bar_coordinates([0.0, 10.0], [5.0, 5.0])
+    reinforcement.set_quantity(2)
+    reinforcement.set_spacing(10.0)
+    reinforcement.calculate_quantity(10.0)
+    np.testing.assert_array_equal(reinforcement.xs, [0.0, 10.0])
+
+
+def test_new_quantity_resets_coordinates():
+    reinforcement = make_reinforcement(quantity=2)
+    reinforcement.set_bar_coordinates([0.0, 10.0], [5.0, 5.0])
+    reinforcement.set_quantity(3)
+    assert np.isnan(reinforcement.xs).all()
+
+
+def test_negative_quantity_is_rejected():
+    reinforcement = make_reinforcement(quantity=2)
+    reinforcement.set_spacing(10.0)
+    with pytest.raises(ValueError, match="negative"):
+        reinforcement.calculate_quantity(-30.0)
+    assert reinforcement.quantity == 2
+
+
+def test_reassigning_bar_updates_diameters():
+    reinforcement = make_reinforcement(quantity=2)
+    reinforcement.bar = Bar(Circular(2.0))
+    np.testing.assert_allclose(reinforcement.diameters, 4.0)
+    assert reinforcement.total_area == pytest.approx(2 * np.pi * 4.0)
+
+
+def test_set_bar_coordinates_requires_one_per_bar():
+    reinforcement = make_reinforcement(quantity=3)
+    with pytest.raises(ValueError, match="one coordinate per bar"):
+        reinforcement.set_bar_coordinates([0.0, 1.0], [0.0, 1.0])
+
+
+def test_group_centroid_is_area_weighted():
+    reinforcement = make_reinforcement(quantity=3)
+    reinforcement.set_bar_coordinates([0.0, 5.0, 10.0], [2.0, 2.0, 2.0])
+    assert reinforcement.group_centroid == pytest.approx((5.0, 2.0))
+    assert reinforcement.total_area == pytest.approx(3 * np.pi)
+
+
+def test_group_centroid_requires_coordinates():
+    reinforcement = make_reinforcement(quantity=2)
+    with pytest.raises(ValueError, match="coordinates"):
+        reinforcement.group_centroid
+
+
+def test_group_centroid_requires_bars():
+    reinforcement = make_reinforcement(quantity=0)
+    with pytest.raises(ValueError, match="greater than 0"):
+        reinforcement.group_centroid
+
+
+@pytest.mark.parametrize("attribute", ["bars", "total_area", "group_centroid"])
+def test_bar_dependent_properties_require_bar(attribute):
+    reinforcement = Reinforcement(quantity=2)
+    with pytest.raises(ValueError, match="valid bar"):
+        getattr(reinforcement, attribute)
+
+
+def test_bars_keep_unassigned_coordinates_unset():
+    reinforcement = make_reinforcement(quantity=2)
+    bars = reinforcement.bars
+    assert [bar.coordinates for bar in bars] == ["No coordinates assigned yet"] * 2
+    reinforcement.set_bar_coordinates([1.0, 2.0], [3.0, 4.0])
+    assert [bar.coordinates for bar in reinforcement.bars] == [(1.0, 3.0), (2.0, 4.0)]
+
+
+def test_bar_geometries_use_bar_positions():
+    reinforcement = make_reinforcement(quantity=2)
+    reinforcement.set_bar_coordinates([0.0, 10.0], [0.0, 0.0])
+    geometries = reinforcement.bar_geometries()
+    assert geometries[1].centroid.x == pytest.approx(10.0)
+    assert geometries[0].area == pytest.approx(np.pi, rel=1e-2)
+
+
+def test_batch_spacing_matches_scalar_formula():
+    result = batch_spacing(np.array([60.0, 100.0]), np.array([5, 3]))
+    np.testing.assert_allclose(result, [15.0, 50.0])
+
+
+def test_batch_quantity_matches_scalar_formula():
+    result = batch_quantity(np.array([60.0, 100.0, 1.0]), np.array([15.0, 30.0, 0.2]))
+    np.testing.assert_array_equal(result, [5, 4, 6])
+
+
+def test_batch_inputs_broadcast():
+    np.testing.assert_allclose(batch_spacing(np.array([10.0, 20.0, 30.0]), np.array([3])),
+                               [5.0, 10.0, 15.0])
+    np.testing.assert_allclose(batch_spacing(np.array([10.0, 20.0]), 3), [5.0, 10.0])
+    np.testing.assert_array_equal(batch_quantity(np.array([10.0, 20.0, 30.0]), np.array([2.0])),
+                                  [6, 11, 16])
+
+
+def test_batch_inputs_keep_2d_shape():
+    result = batch_spacing(np.full((2, 2), 8.0), np.array([[3], [5]]))
+    np.testing.assert_allclose(result, [[4.0, 4.0], [2.0, 2.0]])
+
+
+@pytest.mark.parametrize("function, values", [
+    (batch_spacing, np.array([3, 4])),
+    (batch_quantity, np.array([1.0, 2.0])),
+])
+def test_batch_rejects_mismatched_shapes(function, values):
+    with pytest.raises(ValueError, match="compatible shapes"):
+        function(np.array([10.0, 20.0, 30.0]), values)
+
+
+def test_batch_spacing_rejects_non_integral_quantity():
+    with pytest.raises(ValueError, match="integer"):
+        batch_spacing(np.array([10.0]), np.array([2.9]))
+
+
+def test_batch_spacing_rejects_single_bar():
+    with pytest.raises(ValueError, match="greater than 1"):
+        batch_spacing(np.array([60.0]), np.array([1]))
+
+
+@pytest.mark.parametrize("spacing", [0.0, -1.0])
+def test_batch_quantity_rejects_non_positive_spacing(spacing):
+    with pytest.raises(ValueError, match="greater than 0"):
+        batch_quantity(np.array([60.0]), np.array([spacing]))
+
+
+@pytest.mark.parametrize("spacing", [np.nan, np.inf])
+def test_batch_quantity_rejects_non_finite_spacing(spacing):
+    with pytest.raises(ValueError, match="valid spacing"):
+        batch_quantity(np.array([60.0]), np.array([spacing]))
+
+
+@pytest.mark.parametrize("function, values", [
+    (batch_spacing, np.array([3])),
+    (batch_quantity, np.array([15.0])),
+])
+def test_batch_rejects_non_finite_effective_space(function, values):
+    with pytest.raises(ValueError, match="finite"):
+        function(np.array([np.nan]), values)
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from geometry import GeometryType
+from sections import Element, volumes
+
+
+def make_elements():
+    rectangular = Element(GeometryType.RECTANGULAR)
+    rectangular.set_geometry_from_values(2.0, 3.0, 4.0)
+    circular = Element(GeometryType.CIRCULAR)
+    circular.set_geometry_from_values(5.0, radius=1.5)
+    return [rectangular, circular, rectangular]
+
+
+def test_volumes_match_element_volume():
+    elements = make_elements()
+    result = volumes(
+        np.array([element.section.value for element in elements]),
+        np.array([element.length_1 for element in elements]),
+        np.array([element.length_2 or np.nan for element in elements]),
+        np.array([element.length_3 or np.nan for element in elements]),
+        np.array([element.radius or np.nan for element in elements]),
+    )
+    np.testing.assert_allclose(result, [element.volume() for element in elements])
+
+
+def test_volumes_reject_unknown_kinds():
+    with pytest.raises(ValueError, match="Unsupported geometry type"):
+        volumes(np.array([1, 3]), np.ones(2), np.ones(2), np.ones(2), np.ones(2))
+
+
+@pytest.mark.parametrize("kind, name", [
+    (GeometryType.RECTANGULAR, "RectangularElement"),
+    (GeometryType.CIRCULAR, "CircularElement"),
+])
+def test_element_dispatches_to_subclass(kind, name):
+    assert type(Element(kind)).__name__ == name
+    assert type(Element.create(kind)).__name__ == name
+
+
+def test_element_rejects_unknown_kind():
+    with pytest.raises(ValueError, match="Unsupported geometry type"):
+        Element(None)
+
+
+def test_incomplete_element_subclass_cannot_be_instantiated():
+    class VolumeOnlyElement(Element):
+        def volume(self) -> float:
+            return 0.0
+
+    with pytest.raises(TypeError):
+        VolumeOnlyElement(GeometryType.RECTANGULAR)